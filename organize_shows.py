@@ -7,26 +7,105 @@ Supports multiple shows and flexible filename patterns.
 import os
 import shutil
 import re
-import argparse
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import attrgetter
 from pathlib import Path
+from types import SimpleNamespace
+
+
+# Resolved once so relative sources and the default destination work from symlinked installs
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+# Files copied in parallel unless --jobs says otherwise
+DEFAULT_JOBS = 4
+
+# Lower-case video suffixes; a tuple so str.endswith can test them in one call
+VIDEO_EXTENSIONS = ('.m4v', '.mp4', '.mkv', '.avi', '.ts')
+
+
+def copy_file(src, dst, link=False):
+    """
+    Copy src to dst with its metadata, like shutil.copy2.
+    With link=True, hardlink instead when both are on the same filesystem.
+    """
+    # Re-running over an already linked file must not truncate the source
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        return
+    
+    if link:
+        try:
+            try:
+                os.link(src, dst)
+            except FileExistsError:
+                # Swap the stale file for a link in one step so --link holds on re-runs
+                tmp = f"{dst}.link-tmp"
+                if os.path.lexists(tmp):
+                    os.remove(tmp)
+                os.link(src, tmp)
+                os.replace(tmp, dst)
+            return
+        except OSError:
+            pass  # Different filesystem or links unsupported; copy instead
+    
+    # Never write through an existing dst: an earlier --link run may have made
+    # it the same inode as another source, which truncating would destroy
+    target = dst
+    if os.path.lexists(dst):
+        target = f"{dst}.copy-tmp"
+        if os.path.lexists(target):
+            os.remove(target)
+    
+    try:
+        size = None
+        copied = 0
+        try:
+            # Lets the kernel copy (or reflink on btrfs/xfs) without user-space buffers
+            with open(src, 'rb') as fsrc, open(target, 'wb') as fdst:
+                size = os.fstat(fsrc.fileno()).st_size
+                while copied < size:
+                    sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), size - copied)
+                    if sent == 0:
+                        break
+                    copied += sent
+        except (AttributeError, OSError):
+            size = None
+        
+        if size is None or (copied == 0 and size > 0):
+            # No usable copy_file_range here; copyfile still uses sendfile on Linux
+            shutil.copyfile(src, target)
+        elif copied < size:
+            # Source shrank mid-copy; never report a truncated file as a success
+            raise OSError(f"Short copy: only {copied} of {size} bytes of {src} copied")
+        shutil.copystat(src, target)
+        
+        if target != dst:
+            os.replace(target, dst)
+    except BaseException:
+        if target != dst and os.path.lexists(target):
+            os.remove(target)
+        raise
 
 
 class ShowOrganizer:
     """Handles organizing TV show files into Jellyfin structure."""
     
-    # Define show configurations
+    # Define show configurations (patterns are compiled once, at class definition;
+    # re.ASCII keeps \d and \s to plain ASCII since filenames are ASCII.
+    # The quality part uses [^)]* so it stops at its closing parenthesis)
     SHOWS = {
         'fringe': {
             'name': 'Fringe',
             'patterns': [
-                r'Fringe\s+S(\d{2})E(\d{2})\s+(.+?)\s+\(.*?\)',
+                # Title is optional so names without "(quality)" still parse
+                re.compile(r'Fringe\s+S(\d{2})E(\d{2})(?:\s+(.+?)\s+\([^)]*\))?', re.ASCII | re.IGNORECASE),
             ],
             'output_name': 'Fringe',
         },
         'battlestar': {
             'name': 'Battlestar Galactica',
             'patterns': [
-                r'BSG\s+S(\d{2})E(\d{2})\s+(.+?)\s+\(.*?\)',
+                re.compile(r'BSG\s+S(\d{2})E(\d{2})\s+(.+?)\s+\([^)]*\)', re.ASCII | re.IGNORECASE),
             ],
             'output_name': 'Battlestar Galactica',
         },
@@ -44,11 +123,12 @@ class ShowOrganizer:
         Tries each pattern defined for this show.
         """
         for pattern in self.show_config['patterns']:
-            match = re.search(pattern, filename, re.IGNORECASE)
+            match = pattern.search(filename)
             if match:
                 season = match.group(1)
                 episode = match.group(2)
-                title = match.group(3).strip() if len(match.groups()) >= 3 else None
+                title = match.group(3) if match.re.groups >= 3 else None
+                title = title.strip() if title else None
                 return season, episode, title
         
         return None, None, None
@@ -64,7 +144,8 @@ class ShowOrganizer:
         else:
             return f"{show_name} - S{season}E{episode}{extension}"
     
-    def organize(self, source_dir, dest_parent=None, dry_run=False):
+    def organize(self, source_dir, dest_parent=None, dry_run=False, link=False, jobs=DEFAULT_JOBS,
+                 sorted_output=False):
         """
         Organize TV show files.
         
@@ -72,16 +153,20 @@ class ShowOrganizer:
             source_dir: Source folder containing video files
             dest_parent: Parent directory for all shows (default: ./Media/Shows)
             dry_run: If True, don't actually copy files
+            link: If True, hardlink files instead of copying where possible
+            jobs: Number of files to copy in parallel
+            sorted_output: If True, process files in name order instead of
+                directory order
         """
         source_dir = Path(source_dir)
         
         # If source is relative, make it relative to script directory
         if not source_dir.is_absolute():
-            source_dir = Path(__file__).parent / source_dir
+            source_dir = SCRIPT_DIR / source_dir
         
         # Set destination parent
         if dest_parent is None:
-            dest_parent = Path(__file__).parent / "Media" / "Shows"
+            dest_parent = SCRIPT_DIR / "Media" / "Shows"
         else:
             dest_parent = Path(dest_parent)
         
@@ -101,16 +186,18 @@ class ShowOrganizer:
             return False
         
         # Get all video files
-        video_extensions = {'.m4v', '.mp4', '.mkv', '.avi', '.ts'}
         files = []
         
-        for file in source_dir.iterdir():
-            if file.is_file():
+        # os.scandir reuses the directory entry's file type, so no extra stat per file
+        with os.scandir(source_dir) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
                 # Skip .part files and other non-video files
-                if file.name.endswith('.part'):
+                if entry.name.endswith('.part'):
                     continue
-                if file.suffix.lower() in video_extensions:
-                    files.append(file)
+                if entry.name.lower().endswith(VIDEO_EXTENSIONS):
+                    files.append(entry)
         
         if not files:
             print("No video files found in source directory!")
@@ -118,11 +205,22 @@ class ShowOrganizer:
         
         print(f"Found {len(files)} video files to process\n")
         
-        # Process each file
+        # Phase 1: parse every name and plan its destination (no writes)
         copied_count = 0
         skipped_count = 0
+        existing_count = 0
+        season_dirs = set()
+        planned = []
+        claims = {}  # dest_file -> (file, season_dir, display) of the file that gets it
+        dest_base_str = os.fspath(dest_base)
+        
+        # Destination names carry SxxExx, and duplicates are settled by name
+        # below, so order only matters for the log
+        if sorted_output:
+            # Sort by plain name; all entries share source_dir
+            files.sort(key=attrgetter('name'))
         
-        for file in sorted(files):
+        for file in files:
             season, episode, title = self.parse_episode_info(file.name)
             
             if not season or not episode:
@@ -131,31 +229,92 @@ class ShowOrganizer:
                 continue
             
             # Determine file extension
-            extension = file.suffix
+            extension = os.path.splitext(file.name)[1]
             
-            # Create season directory
-            season_dir = dest_base / f"Season {season}"
-            
-            if not dry_run:
-                season_dir.mkdir(parents=True, exist_ok=True)
+            season_dir = os.path.join(dest_base_str, f"Season {season}")
             
             # Create new filename
             new_filename = self.create_jellyfin_filename(season, episode, title, extension)
-            dest_file = season_dir / new_filename
+            dest_file = os.path.join(season_dir, new_filename)
+            
+            display = f"Season {season}/{new_filename}"
             
-            # Copy file
+            # Two sources (e.g. different qualities) must not race for one
+            # destination; the lowest name wins whatever the directory order
+            claim = claims.get(dest_file)
+            if claim is None:
+                claims[dest_file] = (file, season_dir, display)
+                continue
+            loser = file
+            if file.name < claim[0].name:
+                claims[dest_file] = (file, season_dir, display)
+                loser = claim[0]
+            print(f"⚠ Skipping (duplicate destination): {loser.name}")
+            skipped_count += 1
+        
+        for dest_file, (file, season_dir, display) in claims.items():
+            # An identical copy from an earlier run needs no copying
             try:
-                print(f"{'[DRY RUN] ' if dry_run else ''}Copying: {file.name}")
-                print(f"     To: Season {season}/{new_filename}")
-                
-                if not dry_run:
-                    shutil.copy2(file, dest_file)
-                copied_count += 1
-                print(f"     {'✓ Would copy' if dry_run else '✓ Success'}\n")
-                
-            except Exception as e:
-                print(f"     ✗ Error: {e}\n")
+                try:
+                    dest_stat = os.stat(dest_file)
+                except FileNotFoundError:
+                    dest_stat = None
+                src_stat = file.stat() if dest_stat is not None else None
+            except OSError as e:
+                # e.g. an unreadable season folder, a file where it should be,
+                # or a source removed since the scan
+                print(f"✗ Skipping (can't check file): {file.name}: {e}")
                 skipped_count += 1
+                continue
+            
+            if dest_stat is None:
+                organized = False
+            elif link:
+                # With --link only an existing link counts; a full copy gets replaced
+                organized = os.path.samestat(src_stat, dest_stat)
+            else:
+                organized = (dest_stat.st_size == src_stat.st_size
+                             and abs(dest_stat.st_mtime - src_stat.st_mtime) < 2)
+            if organized:
+                print(f"✓ Already organized: {file.name}")
+                existing_count += 1
+                continue
+            
+            season_dirs.add(season_dir)
+            planned.append((file, dest_file, display))
+        
+        # Phase 2: create each season directory once, before any copies start
+        if not dry_run:
+            for season_dir in season_dirs:
+                os.makedirs(season_dir, exist_ok=True)
+        
+        # Show the planning results before the (possibly long) copies start
+        sys.stdout.flush()
+        
+        # Phase 3: copy files
+        if dry_run:
+            for file, dest_file, display in planned:
+                # One write per file rather than one print per line
+                sys.stdout.write(f"[DRY RUN] Copying: {file.name}\n     To: {display}\n     ✓ Would copy\n\n")
+                copied_count += 1
+        elif planned:
+            # Copies are independent, so run several at once to overlap their I/O
+            with ThreadPoolExecutor(max_workers=min(jobs, len(planned))) as executor:
+                futures = {
+                    executor.submit(copy_file, file.path, dest_file, link): (file, display)
+                    for file, dest_file, display in planned
+                }
+                for future in as_completed(futures):
+                    file, display = futures[future]
+                    try:
+                        future.result()
+                        copied_count += 1
+                        status = "✓ Success"
+                    except Exception as e:
+                        status = f"✗ Error: {e}"
+                        skipped_count += 1
+                    # One write per file rather than one print per line
+                    sys.stdout.write(f"Copying: {file.name}\n     To: {display}\n     {status}\n\n")
         
         # Summary
         print("=" * 70)
@@ -165,6 +324,7 @@ class ShowOrganizer:
         else:
             print(f"Processing complete!")
             print(f"  Successfully copied: {copied_count} files")
+        print(f"  Already organized: {existing_count} files")
         print(f"  Skipped: {skipped_count} files")
         print(f"  Destination: {dest_base}")
         print("=" * 70)
@@ -172,7 +332,49 @@ class ShowOrganizer:
         return True
 
 
-def main():
+def parse_args_fast(argv):
+    """
+    Parse the usual command lines without importing argparse.
+    Returns None for anything else (--help, mistakes, --opt=value) so
+    argparse can handle it and print proper usage.
+    """
+    args = SimpleNamespace(dest=None, dry_run=False, link=False, jobs=DEFAULT_JOBS, sorted_output=False)
+    positional = []
+    
+    argv = iter(argv)
+    for arg in argv:
+        if arg in ('--dry-run', '-n'):
+            args.dry_run = True
+        elif arg in ('--link', '-l'):
+            args.link = True
+        elif arg == '--sorted-output':
+            args.sorted_output = True
+        elif arg in ('--dest', '-d'):
+            args.dest = next(argv, None)
+            # Like argparse, don't take another option as the destination
+            if args.dest is None or args.dest.startswith('-'):
+                return None
+        elif arg in ('--jobs', '-j'):
+            value = next(argv, '')
+            # isdecimal, not isdigit: int() rejects digits like '²'
+            if not value.isdecimal() or int(value) < 1:
+                return None
+            args.jobs = int(value)
+        elif arg.startswith('-'):
+            return None
+        else:
+            positional.append(arg)
+    
+    if len(positional) != 2:
+        return None
+    args.show, args.source = positional
+    return args
+
+
+def parse_args(argv=None):
+    """Full argparse parser; only imported when the fast path gives up."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='Organize TV show files into Jellyfin-compatible structure',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -180,12 +382,16 @@ def main():
 Examples:
   # Organize Fringe files
   python organize_shows.py fringe FringeS04
+  ./organize_fringe FringeS04          # same thing
   
   # Organize Battlestar Galactica files with dry-run
   python organize_shows.py battlestar "Battlestar Galactica Season 1" --dry-run
   
   # Organize with custom destination
   python organize_shows.py fringe FringeS04 --dest /path/to/media/Shows
+  
+  # Hardlink instead of copying (source and destination on the same filesystem)
+  python organize_shows.py fringe FringeS04 --link
         """
     )
     parser.add_argument(
@@ -205,15 +411,42 @@ Examples:
         action='store_true',
         help='Show what would be done without actually copying files'
     )
+    parser.add_argument(
+        '--link', '-l',
+        action='store_true',
+        help='Hardlink instead of copying when source and destination share a filesystem'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f'Number of files to copy in parallel (default: {DEFAULT_JOBS})'
+    )
+    parser.add_argument(
+        '--sorted-output',
+        action='store_true',
+        help='Process files in name order for a predictable log (default: directory order)'
+    )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    return args
+
+
+def main():
+    # Bulk runs (one process per folder) skip argparse's import and setup
+    args = parse_args_fast(sys.argv[1:]) or parse_args()
     
     try:
         organizer = ShowOrganizer(args.show.lower())
         organizer.organize(
             source_dir=args.source,
             dest_parent=args.dest,
-            dry_run=args.dry_run
+            dry_run=args.dry_run,
+            link=args.link,
+            jobs=args.jobs,
+            sorted_output=args.sorted_output
         )
     except ValueError as e:
         print(f"Error: {e}")
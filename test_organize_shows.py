@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Tests for organize_shows.
+Run with: python -m unittest test_organize_shows
+"""
+
+import os
+import tempfile
+import unittest
+
+from organize_shows import ShowOrganizer, copy_file, parse_args, parse_args_fast
+
+
+class ParseEpisodeInfoTest(unittest.TestCase):
+    """Titles may contain parentheses; the first " (" starts the quality part."""
+
+    def test_title_with_parentheses(self):
+        self.assertEqual(
+            ShowOrganizer('battlestar').parse_episode_info('BSG S01E01 33(Part 1) (1080p).mkv'),
+            ('01', '01', '33(Part 1)')
+        )
+
+    def test_title_glued_to_parentheses(self):
+        self.assertEqual(
+            ShowOrganizer('fringe').parse_episode_info('Fringe S01E01 Pilot(Extended) (1080p).mkv'),
+            ('01', '01', 'Pilot(Extended)')
+        )
+
+    def test_title_stops_at_first_spaced_parenthesis(self):
+        self.assertEqual(
+            ShowOrganizer('fringe').parse_episode_info('Fringe S01E01 Pilot (Part 1) (1080p).mkv'),
+            ('01', '01', 'Pilot')
+        )
+
+    def test_fringe_without_quality(self):
+        self.assertEqual(
+            ShowOrganizer('fringe').parse_episode_info('Fringe S04E04 Title.mkv'),
+            ('04', '04', None)
+        )
+
+
+class ParseArgsFastTest(unittest.TestCase):
+    """The argparse-free parser must agree with argparse or defer to it."""
+
+    SUPPORTED = [
+        ['fringe', 'FringeS04'],
+        ['fringe', 'FringeS04', '-n'],
+        ['fringe', 'FringeS04', '--dry-run', '--link'],
+        ['fringe', 'FringeS04', '-l'],
+        ['fringe', 'FringeS04', '-d', '/media/Shows'],
+        ['fringe', 'FringeS04', '--dest', '/media/Shows'],
+        ['fringe', 'FringeS04', '-j', '8'],
+        ['fringe', 'FringeS04', '--jobs', '2'],
+        ['fringe', 'FringeS04', '--sorted-output'],
+        ['-n', 'fringe', '-j', '3', 'FringeS04', '-d', 'out'],
+        ['fringe', '--link', 'FringeS04', '--sorted-output'],
+    ]
+
+    FALLBACK = [
+        ['fringe', 'FringeS04', '-j', '0'],
+        ['fringe', 'FringeS04', '-j', '\u00b2'],
+        ['fringe', 'FringeS04', '--dest', '-x'],
+        ['fringe', 'FringeS04', '--jobs=4'],
+        ['fringe', 'FringeS04', '-nl'],
+        ['fringe', 'FringeS04', '--dest'],
+        ['fringe'],
+        ['--help'],
+    ]
+
+    def test_matches_argparse(self):
+        for argv in self.SUPPORTED:
+            with self.subTest(argv=argv):
+                self.assertEqual(vars(parse_args_fast(argv)), vars(parse_args(argv)))
+
+    def test_defers_to_argparse(self):
+        for argv in self.FALLBACK:
+            with self.subTest(argv=argv):
+                self.assertIsNone(parse_args_fast(argv))
+
+
+class CopyFileTest(unittest.TestCase):
+    """copy_file must never write through a destination shared with a source."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def write(self, name, data):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def read(self, path):
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def test_copy_over_linked_destination_keeps_linked_source(self):
+        linked_src = self.write('a.mkv', b'1080p')
+        other_src = self.write('b.mkv', b'720p bytes')
+        dst = os.path.join(self.tmp.name, 'dest.mkv')
+
+        copy_file(linked_src, dst, link=True)
+        self.assertTrue(os.path.samefile(linked_src, dst))
+
+        copy_file(other_src, dst)
+        self.assertEqual(self.read(linked_src), b'1080p')
+        self.assertEqual(self.read(dst), b'720p bytes')
+        self.assertFalse(os.path.samefile(linked_src, dst))
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ['a.mkv', 'b.mkv', 'dest.mkv'])
+
+    def test_link_replaces_existing_copy(self):
+        src = self.write('a.mkv', b'new')
+        dst = self.write('dest.mkv', b'old copy')
+
+        copy_file(src, dst, link=True)
+        self.assertTrue(os.path.samefile(src, dst))
+
+
+if __name__ == "__main__":
+    unittest.main()